@@ -1,15 +1,19 @@
 import logging
-import xml.etree.ElementTree as ET
+import re
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Union, Optional
+from copy import deepcopy
+from io import StringIO
+from typing import Dict, List, NamedTuple, TextIO, Tuple, Union, Optional
+from xml.sax.saxutils import escape
 
 from docx import Document as DocxDocument
 from docx.document import Document as DocxDocument2
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, nsmap, qn
 from docx.text.paragraph import Paragraph as DocxParagraph
 from docx.table import _Cell, Table as DocxTable
-from docx.oxml.text.paragraph import CT_P
-from docx.oxml.table import CT_Tbl
-from docx.shared import Cm
+from docx.shared import Emu
+from lxml import etree as ET
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +27,46 @@ logger = logging.getLogger(__name__)
 
 # Constants
 TOTAL_TABLE_WIDTH_CM = 15  # Total table width in cm for Word documents
+EMUS_PER_CM = 360000  # English Metric Units per cm, as used by python-docx
+
+# Run content with a text equivalent in a paragraph, in document order, see _cell_text
+_RUN_CONTENT = ET.XPath(
+    './w:r/*[self::w:br or self::w:cr or self::w:noBreakHyphen or self::w:ptab or self::w:t or self::w:tab]'
+    ' | ./w:hyperlink/w:r/*[self::w:br or self::w:cr or self::w:noBreakHyphen or self::w:ptab'
+    ' or self::w:t or self::w:tab]',
+    namespaces={'w': nsmap['w']}
+)
+
+# Cell properties of horizontally or vertically merged cells in a table
+_MERGED_CELLS = ET.XPath('./w:tr/w:tc/w:tcPr/w:gridSpan | ./w:tr/w:tc/w:tcPr/w:vMerge', namespaces={'w': nsmap['w']})
+
+# Column width in EMU per width percentage, see _width_to_emu
+_width_cache: Dict[str, int] = {}
+
+# Shared column definitions, so that recurring table schemas reuse the same tuples
+_column_intern: Dict[Tuple[str, Optional[str]], Tuple[str, Optional[str]]] = {}
+
+# Single-run paragraph copied into table cells, see _set_cell_text
+_CELL_PARAGRAPH = parse_xml(f'<w:p {nsdecls("w")}><w:r><w:t/></w:r></w:p>')
+
+# Block kinds of a Word document, see classify_blocks
+TITLE, HEADING, PARA, TABLE = range(4)
+
+# Built-in heading style names, other 'Heading' styles are parsed by _classify
+_HEADING_RE = re.compile(r'^Heading (\d+)$')
+
+# Block kind and heading level per paragraph style id, see _classify
+_style_cache: Dict[Optional[str], Tuple[int, int]] = {}
+
+# python-docx block type per block-level element tag, see iter_block_items
+_BLOCK_TYPES = {qn('w:p'): DocxParagraph, qn('w:tbl'): DocxTable}
+
+# Entities escaped in addition to &, < and >, as done by the lxml serializer
+_TEXT_ENTITIES = {'\r': '&#13;'}
+_ATTRIBUTE_ENTITIES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'}
+
+# Empty default Word document, copied for every output, see Document.to_word
+_TEMPLATE: Optional[DocxDocument2] = None
 
 
 def iter_block_items(parent: Union[DocxDocument2, _Cell]):
@@ -35,7 +79,7 @@ def iter_block_items(parent: Union[DocxDocument2, _Cell]):
     Yields:
         DocxParagraph or DocxTable objects.
     """
-    logger.debug(f"Iterating block items for parent: {type(parent).__name__}")
+    logger.debug("Iterating block items for parent: %s", type(parent).__name__)
     if isinstance(parent, DocxDocument2):
         parent_elm = parent.element.body
     elif isinstance(parent, _Cell):
@@ -45,12 +89,172 @@ def iter_block_items(parent: Union[DocxDocument2, _Cell]):
         raise ValueError("Invalid parent type provided to iter_block_items.")
 
     for child in parent_elm.iterchildren():
-        if isinstance(child, CT_P):
-            yield DocxParagraph(child, parent)
-        elif isinstance(child, CT_Tbl):
-            yield DocxTable(child, parent)
+        block_type = _BLOCK_TYPES.get(child.tag)
+        if block_type is not None:
+            yield block_type(child, parent)
         else:
-            logger.warning(f"Unknown child type encountered: {type(child)}")
+            logger.warning("Unknown child type encountered: %s", child.tag)
+
+
+def _classify(paragraph: DocxParagraph) -> Tuple[int, int]:
+    """
+    Classify a paragraph by its style name.
+
+    The style is resolved through python-docx only once per style id; the
+    result is memoized in _style_cache, which is cleared for every document.
+
+    Returns:
+        A tuple of the block kind (TITLE, HEADING or PARA) and the heading level,
+        or -1 if the paragraph is not a valid heading.
+    """
+    style_id = paragraph._p.style
+    classification = _style_cache.get(style_id)
+    if classification is None:
+        style_name = paragraph.style.name
+        classification = (PARA, -1)
+        match = _HEADING_RE.match(style_name)
+        if match is not None:
+            classification = (HEADING, int(match.group(1)))
+        elif style_name.startswith('Heading'):
+            try:
+                classification = (HEADING, int(style_name.split()[-1]))
+            except (IndexError, ValueError):
+                logger.error("Invalid heading style format: '%s'", style_name)
+                classification = (HEADING, -1)
+        elif style_name.startswith('Title'):
+            classification = (TITLE, -1)
+        _style_cache[style_id] = classification
+    return classification
+
+
+def _width_to_emu(width: str) -> int:
+    """
+    Convert a column width percentage of TOTAL_TABLE_WIDTH_CM to EMU.
+
+    Results are memoized in _width_cache, tables usually share their widths.
+
+    Raises:
+        ValueError: If the width is not a number.
+    """
+    emu = _width_cache.get(width)
+    if emu is None:
+        column_width_cm = (float(width) / 100) * TOTAL_TABLE_WIDTH_CM
+        emu = int(column_width_cm * EMUS_PER_CM)
+        _width_cache[width] = emu
+    return emu
+
+
+def _cell_text(tc) -> str:
+    """
+    Get the text of a table cell element.
+
+    Same result as _Cell.text: paragraphs are joined by newlines and tabs
+    and breaks are mapped to their text equivalent, but the run content of
+    each paragraph is collected with a single compiled XPath query.
+
+    Args:
+        tc: The w:tc element of the cell.
+    """
+    return "\n".join("".join(map(str, _RUN_CONTENT(p))) for p in tc.iterchildren(qn('w:p')))
+
+
+def _set_cell_text(tc, text: str) -> None:
+    """
+    Fill a freshly created table cell element with a single run of text.
+
+    For a new cell, whose only content is an empty paragraph, this gives
+    the same XML as assigning _Cell.text, but copies a prebuilt paragraph
+    instead of building it through the python-docx object model. Other
+    cell content than w:p elements is not removed. Text with tabs or line
+    breaks goes through the run text setter, which maps them to w:tab and
+    w:br elements.
+
+    Args:
+        tc: The w:tc element of a new cell.
+        text: The cell text.
+    """
+    for p in tc.findall(qn('w:p')):
+        tc.remove(p)
+    p = deepcopy(_CELL_PARAGRAPH)
+    r = p[0]
+    if not text:
+        r.remove(r[0])
+    elif '\t' in text or '\n' in text or '\r' in text:
+        r.text = text
+    else:
+        t = r[0]
+        t.text = text
+        if len(text.strip()) < len(text):
+            t.set(qn('xml:space'), 'preserve')
+    tc.append(p)
+
+
+def _xml_attribute(name: str, value: str) -> str:
+    """
+    Format an escaped XML attribute, including its leading space.
+    """
+    return f' {name}="{escape(value, _ATTRIBUTE_ENTITIES)}"'
+
+
+def _write_xml_text_element(out: TextIO, tag: str, text: Optional[str], attributes: str = '') -> None:
+    """
+    Write an XML element that only contains text.
+
+    Args:
+        out: The text stream to write to.
+        tag: The element tag.
+        text: The element text, or None for an empty element.
+        attributes: Attributes formatted with _xml_attribute.
+    """
+    if text is None:
+        out.write(f'<{tag}{attributes}/>')
+    else:
+        out.write(f'<{tag}{attributes}>{escape(text, _TEXT_ENTITIES)}</{tag}>')
+
+
+class BlockArrays(NamedTuple):
+    """
+    Block-level items of a Word document, classified into aligned lists.
+    """
+    kinds: List[int]  # TITLE, HEADING, PARA or TABLE
+    heading_levels: List[int]  # Heading level, or -1 if not a valid heading
+    texts: List[str]  # Stripped paragraph text, empty for tables
+    tables: List[Optional[DocxTable]]  # Original table, None for paragraphs
+
+
+def classify_blocks(blocks: List[Union[DocxParagraph, DocxTable]]) -> BlockArrays:
+    """
+    Classify block-level items in a single pass.
+
+    Args:
+        blocks: List of paragraphs and tables from the Word document.
+
+    Returns:
+        The blocks as aligned kind, heading level, text and table lists.
+    """
+    logger.debug("Classifying %s block items.", len(blocks))
+    kinds: List[int] = []
+    heading_levels: List[int] = []
+    texts: List[str] = []
+    tables: List[Optional[DocxTable]] = []
+    # Bind the appends once, this loop runs for every block of the document
+    add_kind, add_heading_level = kinds.append, heading_levels.append
+    add_text, add_table = texts.append, tables.append
+
+    for block in blocks:
+        if isinstance(block, DocxTable):
+            add_kind(TABLE)
+            add_heading_level(-1)
+            add_text("")
+            add_table(block)
+        else:
+            kind, heading_level = _classify(block)
+            add_kind(kind)
+            add_heading_level(heading_level)
+            add_text(block.text.strip())
+            add_table(None)
+
+    return BlockArrays(kinds, heading_levels, texts, tables)
 
 
 class DocumentElement(ABC):
@@ -88,6 +292,13 @@ class DocumentElement(ABC):
         """
         pass
 
+    @abstractmethod
+    def _write_xml(self, out: TextIO) -> None:
+        """
+        Write the element as XML text, without building an XML element.
+        """
+        pass
+
 
 class Table(DocumentElement):
     """
@@ -97,7 +308,7 @@ class Table(DocumentElement):
     def __init__(self, columns: List[Tuple[str, Optional[str]]], rows: List[List[str]]):
         self.columns = columns  # List of tuples (column name, width percentage)
         self.rows = rows
-        logger.debug(f"Initialized Table with columns: {self.columns} and rows: {self.rows}")
+        logger.debug("Initialized Table with columns: %s and rows: %s", self.columns, self.rows)
 
     @classmethod
     def from_xml(cls, table_element: ET.Element) -> 'Table':
@@ -105,17 +316,17 @@ class Table(DocumentElement):
         Create a Table instance from an XML element.
         """
         logger.info("Parsing Table from XML.")
-        columns = [
-            (col.text, col.attrib.get('width'))
-            for col in table_element.find('columns').findall('column')
-        ]
+        columns = []
+        for col in table_element.find('columns').findall('column'):
+            column = (col.text, col.attrib.get('width'))
+            columns.append(_column_intern.setdefault(column, column))
         rows = []
         rows_element = table_element.find('rows')
         if rows_element is not None:
             for row in rows_element.findall('row'):
                 row_data = [cell.text or "" for cell in row.findall('cell')]
                 rows.append(row_data)
-        logger.debug(f"Parsed Table columns: {columns}, rows: {rows}")
+        logger.debug("Parsed Table columns: %s, rows: %s", columns, rows)
         return cls(columns, rows)
 
     @classmethod
@@ -126,13 +337,19 @@ class Table(DocumentElement):
         logger.info("Parsing Table from Word document.")
         columns = []
         rows = []
-        if table.rows:
-            header_cells = table.rows[0].cells
-            for cell in header_cells:
-                columns.append((cell.text.strip(), None))  # Width handling can be enhanced
-            for row in table.rows[1:]:
-                rows.append([cell.text.strip() for cell in row.cells])
-        logger.debug(f"Parsed Table from Word with columns: {columns}, rows: {rows}")
+        tbl = table._tbl
+        if _MERGED_CELLS(tbl):
+            # python-docx repeats merged cells once per grid column they span
+            cell_texts = [[cell.text for cell in row.cells] for row in table.rows]
+        else:
+            cell_texts = [[_cell_text(tc) for tc in tr.tc_lst] for tr in tbl.tr_lst]
+        if cell_texts:
+            for text in cell_texts[0]:
+                column = (text.strip(), None)  # Width handling can be enhanced
+                columns.append(_column_intern.setdefault(column, column))
+            for row_texts in cell_texts[1:]:
+                rows.append([text.strip() for text in row_texts])
+        logger.debug("Parsed Table from Word with columns: %s, rows: %s", columns, rows)
         return cls(columns, rows)
 
     def to_word(self, docx_document: DocxDocument, level: int = 1) -> None:
@@ -145,26 +362,28 @@ class Table(DocumentElement):
             return
 
         table = docx_document.add_table(rows=1, cols=len(self.columns))
+        row_template = deepcopy(table._tbl.tr_lst[0])  # Empty row, as created by add_row
         hdr_cells = table.rows[0].cells
 
         # Set column headers and widths
         for i, (col, width) in enumerate(self.columns):
-            hdr_cells[i].text = col
+            _set_cell_text(hdr_cells[i]._tc, col)
             if width:
                 try:
-                    width_percentage = float(width)
-                    column_width_cm = (width_percentage / 100) * TOTAL_TABLE_WIDTH_CM
-                    hdr_cells[i].width = Cm(column_width_cm)
-                    logger.debug(f"Set width for column '{col}' to {column_width_cm} cm.")
+                    column_width = Emu(_width_to_emu(width))
+                    hdr_cells[i].width = column_width
+                    logger.debug("Set width for column '%s' to %s cm.", col, column_width.cm)
                 except ValueError:
-                    logger.warning(f"Invalid width value '{width}' for column '{col}'.")
+                    logger.warning("Invalid width value '%s' for column '%s'.", width, col)
 
-        # Add data rows
+        # Add data rows, built as copies of the empty row and appended at once
+        rows = []
         for row_data in self.rows:
-            row_cells = table.add_row().cells
-            for i, cell_data in enumerate(row_data):
-                if i < len(row_cells):
-                    row_cells[i].text = cell_data
+            tr = deepcopy(row_template)
+            for tc, cell_data in zip(tr.tc_lst, row_data):
+                _set_cell_text(tc, cell_data)
+            rows.append(tr)
+        table._tbl.extend(rows)
         logger.debug("Table added to Word document successfully.")
 
     def to_xml(self) -> ET.Element:
@@ -189,6 +408,36 @@ class Table(DocumentElement):
         logger.debug("Table converted to XML successfully.")
         return table_element
 
+    def _write_xml(self, out: TextIO) -> None:
+        """
+        Write the table as XML text.
+        """
+        logger.info("Converting Table to XML.")
+        out.write('<table>')
+        if self.columns:
+            out.write('<columns>')
+            for col, width in self.columns:
+                _write_xml_text_element(out, 'column', col, _xml_attribute('width', width) if width else '')
+            out.write('</columns>')
+        else:
+            out.write('<columns/>')
+
+        if self.rows:
+            out.write('<rows>')
+            for row in self.rows:
+                if row:
+                    out.write('<row>')
+                    for cell in row:
+                        _write_xml_text_element(out, 'cell', cell)
+                    out.write('</row>')
+                else:
+                    out.write('<row/>')
+            out.write('</rows>')
+        else:
+            out.write('<rows/>')
+        out.write('</table>')
+        logger.debug("Table converted to XML successfully.")
+
     def __repr__(self) -> str:
         return f"Table(columns={self.columns}, rows={self.rows})"
 
@@ -199,8 +448,10 @@ class Paragraph(DocumentElement):
     """
 
     def __init__(self, text: str):
+        # No fast path for clean text: strip() returns the same str object when
+        # there is nothing to strip, which beats any check done in Python
         self.text = text.strip()
-        logger.debug(f"Initialized Paragraph with text: {self.text}")
+        logger.debug("Initialized Paragraph with text: %s", self.text)
 
     @classmethod
     def from_xml(cls, paragraph_element: ET.Element) -> 'Paragraph':
@@ -209,7 +460,7 @@ class Paragraph(DocumentElement):
         """
         logger.info("Parsing Paragraph from XML.")
         text = paragraph_element.text or ""
-        logger.debug(f"Parsed Paragraph text: {text}")
+        logger.debug("Parsed Paragraph text: %s", text)
         return cls(text)
 
     @classmethod
@@ -219,7 +470,7 @@ class Paragraph(DocumentElement):
         """
         logger.info("Parsing Paragraph from Word document.")
         text = paragraph.text
-        logger.debug(f"Parsed Paragraph text: {text}")
+        logger.debug("Parsed Paragraph text: %s", text)
         return cls(text)
 
     def to_word(self, docx_document: DocxDocument, level: int = 1) -> None:
@@ -240,6 +491,14 @@ class Paragraph(DocumentElement):
         logger.debug("Paragraph converted to XML successfully.")
         return paragraph_element
 
+    def _write_xml(self, out: TextIO) -> None:
+        """
+        Write the paragraph as XML text.
+        """
+        logger.info("Converting Paragraph to XML.")
+        _write_xml_text_element(out, 'paragraph', self.text)
+        logger.debug("Paragraph converted to XML successfully.")
+
     def __repr__(self) -> str:
         return f"Paragraph(text={self.text})"
 
@@ -253,7 +512,7 @@ class Chapter(DocumentElement):
         self.title = title.strip()
         self.id_ = id_
         self.elements = elements or []
-        logger.debug(f"Initialized Chapter with title: '{self.title}', id: '{self.id_}', elements count: {len(self.elements)}")
+        logger.debug("Initialized Chapter with title: '%s', id: '%s', elements count: %s", self.title, self.id_, len(self.elements))
 
     @classmethod
     def from_xml(cls, chapter_element: ET.Element) -> 'Chapter':
@@ -273,112 +532,106 @@ class Chapter(DocumentElement):
             elif child.tag == 'paragraph':
                 elements.append(Paragraph.from_xml(child))
             else:
-                logger.warning(f"Unknown element '{child.tag}' encountered in Chapter.")
+                logger.warning("Unknown element '%s' encountered in Chapter.", child.tag)
 
-        logger.debug(f"Parsed Chapter '{title}' with {len(elements)} elements.")
+        logger.debug("Parsed Chapter '%s' with %s elements.", title, len(elements))
         return cls(title, id_, elements)
 
     @classmethod
-    def from_word(
-        cls,
-        paragraphs: List[Union[DocxParagraph, DocxTable]],
-        current_index: int,
-        heading_level: int,
-        docx_document: DocxDocument
-    ) -> Tuple[List['Chapter'], int]:
+    def from_word(cls, blocks: BlockArrays, current_index: int = 0) -> List['Chapter']:
         """
-        Recursively parse chapters from the given paragraphs starting at current_index.
+        Parse chapters from the given blocks starting at current_index.
+
+        The blocks are walked in a single pass, keeping a stack of the open
+        chapters. A heading closes every open chapter of the same or a deeper
+        level and is nested into the chapter left on top of the stack.
 
         Args:
-            paragraphs: List of paragraphs and tables from the Word document.
-            current_index: Current index in the paragraphs list.
-            heading_level: Current heading level to parse.
-            docx_document: The Word document object.
+            blocks: Classified paragraphs and tables from the Word document.
+            current_index: Index of the first block to parse.
 
         Returns:
-            A tuple containing the list of parsed chapters and the updated current_index.
+            The list of parsed top-level chapters.
         """
-        logger.info(f"Parsing chapters starting at index {current_index} with heading level {heading_level}.")
+        logger.info("Parsing chapters starting at index %s.", current_index)
         chapters: List[Chapter] = []
-        current_chapter: Optional[Chapter] = None
+        open_chapters: List[Tuple[int, Chapter]] = []  # (heading level, chapter), innermost last
+        kinds, heading_levels, texts, tables = blocks
 
-        while current_index < len(paragraphs):
-            block = paragraphs[current_index]
+        for index in range(current_index, len(kinds)):
+            kind = kinds[index]
 
-            if isinstance(block, DocxParagraph) and block.style.name.startswith('Heading'):
-                try:
-                    current_heading_level = int(block.style.name.split()[-1])
-                except (IndexError, ValueError):
-                    logger.error(f"Invalid heading style format: '{block.style.name}'")
-                    current_index += 1
+            if kind == HEADING:
+                heading_level = heading_levels[index]
+                if heading_level < 0:
                     continue
 
-                logger.debug(f"Found heading at index {current_index} with level {current_heading_level}.")
-
-                if current_heading_level < heading_level:
-                    logger.debug("Encountered a higher-level heading. Ending current chapter parsing.")
-                    break
-                elif current_heading_level == heading_level:
-                    if current_chapter is not None:
-                        chapters.append(current_chapter)
-                        logger.debug(f"Added Chapter '{current_chapter.title}' to chapters list.")
-                    # Create a new chapter
-                    current_chapter = Chapter(block.text, id_=f"chapter-{current_index}")
-                    logger.debug(f"Started new Chapter '{current_chapter.title}'.")
-                    current_index += 1
-                else:  # current_heading_level > heading_level
-                    # Handle subchapters recursively
-                    subchapters, current_index = Chapter.from_word(
-                        paragraphs, current_index, current_heading_level, docx_document
-                    )
-                    if current_chapter is not None:
-                        current_chapter.elements.extend(subchapters)
-                        logger.debug(f"Added {len(subchapters)} subchapters to Chapter '{current_chapter.title}'.")
-            elif isinstance(block, DocxTable):
-                if current_chapter is not None:
-                    table = Table.from_word(block)
-                    current_chapter.elements.append(table)
-                    logger.debug(f"Added Table to Chapter '{current_chapter.title}'.")
-                current_index += 1
-            elif isinstance(block, DocxParagraph):
-                if block.text.strip():
-                    if current_chapter is not None:
-                        paragraph = Paragraph.from_word(block)
-                        current_chapter.elements.append(paragraph)
-                        logger.debug(f"Added Paragraph to Chapter '{current_chapter.title}'.")
-                current_index += 1
-            else:
-                logger.warning(f"Unknown block type at index {current_index}: {type(block).__name__}")
-                current_index += 1
-
-        if current_chapter is not None:
-            chapters.append(current_chapter)
-            logger.debug(f"Added final Chapter '{current_chapter.title}' to chapters list.")
-
-        logger.info(f"Parsed {len(chapters)} chapters starting from index {current_index}.")
-        return chapters, current_index
+                logger.debug("Found heading at index %s with level %s.", index, heading_level)
+                while open_chapters and open_chapters[-1][0] >= heading_level:
+                    open_chapters.pop()
+
+                chapter = Chapter(texts[index], id_=f"chapter-{index}")
+                if open_chapters:
+                    parent = open_chapters[-1][1]
+                    parent.elements.append(chapter)
+                    logger.debug("Added Chapter '%s' to Chapter '%s'.", chapter.title, parent.title)
+                elif heading_level == 1:
+                    chapters.append(chapter)
+                    logger.debug("Added Chapter '%s' to chapters list.", chapter.title)
+                else:
+                    # Subchapters without an enclosing chapter are dropped
+                    logger.debug("Chapter '%s' has no level 1 parent and is skipped.", chapter.title)
+                open_chapters.append((heading_level, chapter))
+            elif not open_chapters:
+                continue
+            elif kind == TABLE:
+                current_chapter = open_chapters[-1][1]
+                current_chapter.elements.append(Table.from_word(tables[index]))
+                logger.debug("Added Table to Chapter '%s'.", current_chapter.title)
+            elif texts[index]:  # PARA or TITLE
+                current_chapter = open_chapters[-1][1]
+                current_chapter.elements.append(Paragraph(texts[index]))
+                logger.debug("Added Paragraph to Chapter '%s'.", current_chapter.title)
+
+        logger.info("Parsed %s chapters.", len(chapters))
+        return chapters
 
     def to_word(self, docx_document: DocxDocument, level: int = 1) -> None:
         """
         Add the chapter and its elements to a Word document.
         """
-        logger.info(f"Adding Chapter '{self.title}' to Word document at level {level}.")
+        logger.info("Adding Chapter '%s' to Word document at level %s.", self.title, level)
         docx_document.add_heading(self.title, level=level)
         for element in self.elements:
             element.to_word(docx_document, level=level + 1)
-        logger.debug(f"Chapter '{self.title}' added to Word document successfully.")
+        logger.debug("Chapter '%s' added to Word document successfully.", self.title)
 
     def to_xml(self) -> ET.Element:
         """
         Convert the chapter to an XML element.
         """
-        logger.info(f"Converting Chapter '{self.title}' to XML.")
+        logger.info("Converting Chapter '%s' to XML.", self.title)
         chapter_element = ET.Element('chapter', title=self.title, id=self.id_)
         for element in self.elements:
             chapter_element.append(element.to_xml())
-        logger.debug(f"Chapter '{self.title}' converted to XML successfully.")
+        logger.debug("Chapter '%s' converted to XML successfully.", self.title)
         return chapter_element
 
+    def _write_xml(self, out: TextIO) -> None:
+        """
+        Write the chapter and its elements as XML text.
+        """
+        logger.info("Converting Chapter '%s' to XML.", self.title)
+        attributes = _xml_attribute('title', self.title) + _xml_attribute('id', self.id_)
+        if self.elements:
+            out.write(f'<chapter{attributes}>')
+            for element in self.elements:
+                element._write_xml(out)
+            out.write('</chapter>')
+        else:
+            out.write(f'<chapter{attributes}/>')
+        logger.debug("Chapter '%s' converted to XML successfully.", self.title)
+
     def __repr__(self) -> str:
         return f"Chapter(title='{self.title}', id='{self.id_}', elements={self.elements})"
 
@@ -391,22 +644,58 @@ class Document:
     def __init__(self, title: str, elements: List[DocumentElement]):
         self.title = title.strip()
         self.elements = elements
-        logger.debug(f"Initialized Document with title: '{self.title}' and {len(self.elements)} elements.")
+        logger.debug("Initialized Document with title: '%s' and %s elements.", self.title, len(self.elements))
 
     @classmethod
-    def from_xml(cls, xml_string: str) -> 'Document':
+    def from_xml(cls, file_path: str) -> 'Document':
         """
-        Create a Document instance from an XML string.
+        Create a Document instance from an XML (.x2doc) file.
+
+        The file is parsed incrementally: chapters are built from the parse
+        events as they arrive and each subtree is cleared once consumed, so
+        the full XML tree is never held in memory.
         """
-        logger.info("Parsing Document from XML string.")
-        root = ET.fromstring(xml_string)
-        title = root.attrib.get('title', 'Untitled Document')
+        logger.info("Parsing Document from XML file: '%s'.", file_path)
+        title = 'Untitled Document'
         elements: List[DocumentElement] = []
+        # One entry per open XML element: the Chapter it builds, or None
+        open_elements: List[Optional[Chapter]] = []
+        _column_intern.clear()
+
+        for event, element in ET.iterparse(file_path, events=('start', 'end')):
+            if event == 'start':
+                parent = open_elements[-1] if open_elements else None
+                current: Optional[Chapter] = None
+                if not open_elements:
+                    title = element.attrib.get('title', 'Untitled Document')
+                elif element.tag == 'chapter' and (parent is not None or len(open_elements) == 1):
+                    logger.info("Parsing Chapter from XML.")
+                    current = Chapter(
+                        element.attrib.get('title', 'Untitled Chapter'),
+                        element.attrib.get('id', 'unknown-id')
+                    )
+                elif parent is not None and element.tag not in ('table', 'paragraph'):
+                    logger.warning("Unknown element '%s' encountered in Chapter.", element.tag)
+                open_elements.append(current)
+                continue
+
+            current = open_elements.pop()
+            parent = open_elements[-1] if open_elements else None
+            if current is not None:
+                if parent is not None:
+                    parent.elements.append(current)
+                else:
+                    elements.append(current)
+                logger.debug("Parsed Chapter '%s' with %s elements.", current.title, len(current.elements))
+            elif parent is not None and element.tag == 'table':
+                parent.elements.append(Table.from_xml(element))
+            elif parent is not None and element.tag == 'paragraph':
+                parent.elements.append(Paragraph.from_xml(element))
+            else:
+                continue
+            element.clear()
 
-        for chapter_element in root.findall('chapter'):
-            elements.append(Chapter.from_xml(chapter_element))
-
-        logger.debug(f"Parsed Document with title: '{title}' and {len(elements)} chapters.")
+        logger.debug("Parsed Document with title: '%s' and %s chapters.", title, len(elements))
         return cls(title, elements)
 
     @classmethod
@@ -414,57 +703,85 @@ class Document:
         """
         Create a Document instance from a Word (.docx) file.
         """
-        logger.info(f"Parsing Document from Word file: '{file_path}'.")
+        logger.info("Parsing Document from Word file: '%s'.", file_path)
         docx_document = DocxDocument(file_path)
-        blocks = list(iter_block_items(docx_document))  # Collect all paragraphs and tables
+        _style_cache.clear()
+        _column_intern.clear()
+        blocks = classify_blocks(list(iter_block_items(docx_document)))  # Collect all paragraphs and tables
 
-        chapters: List[Chapter] = []
         index = 0
         title: Optional[str] = None
 
-        while index < len(blocks):
-            block = blocks[index]
-            if isinstance(block, DocxParagraph) and block.style.name.startswith('Title'):
-                title = block.text.strip()
-                logger.debug(f"Document title found: '{title}'.")
-                index += 1
-            else:
-                new_chapters, index = Chapter.from_word(blocks, index, 1, docx_document)
-                chapters.extend(new_chapters)
+        while index < len(blocks.kinds) and blocks.kinds[index] == TITLE:
+            title = blocks.texts[index]
+            logger.debug("Document title found: '%s'.", title)
+            index += 1
+
+        chapters = Chapter.from_word(blocks, index)
 
         if not title:
             title = "Untitled Document"
             logger.warning("No title found in the Word document. Using default title.")
 
-        logger.info(f"Parsed Document titled '{title}' with {len(chapters)} chapters.")
+        logger.info("Parsed Document titled '%s' with %s chapters.", title, len(chapters))
         return cls(title, chapters)
 
     def to_word(self, file_name: str) -> None:
         """
         Save the Document to a Word (.docx) file.
         """
-        logger.info(f"Saving Document to Word file: '{file_name}'.")
-        docx_document = DocxDocument()
+        logger.info("Saving Document to Word file: '%s'.", file_name)
+        global _TEMPLATE
+        if _TEMPLATE is None:
+            _TEMPLATE = DocxDocument()
+        docx_document = deepcopy(_TEMPLATE)
         docx_document.add_heading(self.title, level=0)
-        logger.debug(f"Added document title '{self.title}' to Word document.")
+        logger.debug("Added document title '%s' to Word document.", self.title)
 
         for element in self.elements:
             element.to_word(docx_document)
 
         docx_document.save(file_name)
-        logger.info(f"Document saved to '{file_name}' successfully.")
+        logger.info("Document saved to '%s' successfully.", file_name)
 
     def to_xml(self) -> str:
         """
         Convert the Document to an XML string.
         """
         logger.info("Converting Document to XML string.")
-        document_element = ET.Element('document', title=self.title)
-        for element in self.elements:
-            document_element.append(element.to_xml())
-        xml_string = ET.tostring(document_element, encoding='unicode')
+        out = StringIO()
+        self._write_xml(out)
         logger.debug("Document converted to XML successfully.")
-        return xml_string
+        return out.getvalue()
+
+    def to_xml_file(self, file_name: str) -> None:
+        """
+        Save the Document to an XML (.x2doc) file.
+
+        The XML is written to the file as it is generated, UTF-8 encoded and
+        with an XML declaration.
+        """
+        logger.info("Saving Document to XML file: '%s'.", file_name)
+        with open(file_name, 'w', encoding='utf-8') as out:
+            out.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            self._write_xml(out)
+        logger.info("Document saved to '%s' successfully.", file_name)
+
+    def _write_xml(self, out: TextIO) -> None:
+        """
+        Write the Document as XML text.
+
+        The elements write their XML directly to the stream, no XML tree is
+        built in between.
+        """
+        attributes = _xml_attribute('title', self.title)
+        if self.elements:
+            out.write(f'<document{attributes}>')
+            for element in self.elements:
+                element._write_xml(out)
+            out.write('</document>')
+        else:
+            out.write(f'<document{attributes}/>')
 
     def __repr__(self) -> str:
         return f"Document(title='{self.title}', elements={self.elements})"
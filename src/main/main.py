@@ -1,4 +1,7 @@
 # main.py
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
 from invoke import Collection, Context
 import tasks
 
@@ -28,22 +31,49 @@ def execute_task(ns, task_name, ctx, executed=None, *args):
     # Mark this task as executed
     executed.add(task_name)
 
-def main():
-    # Collect all tasks from tasks.py
+def run_task(task_name, *args):
+    # Each worker process builds its own collection and context
     ns = Collection.from_module(tasks)
+    try:
+        execute_task(ns, task_name, Context(), None, *args)
+    except Exception as e:
+        # Report the failure and go on with the other files of the batch
+        print(f"Task '{task_name}' failed with arguments {args}: {e!r}")
+        return False
+    return True
+
+def execute_task_batch(task_name, file_pairs, max_workers=None, chunksize=4):
+    # Run the task once per (input, output) pair, spread over worker processes
+    input_files = [input_file for input_file, _ in file_pairs]
+    output_files = [output_file for _, output_file in file_pairs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run_task, repeat(task_name), input_files, output_files, chunksize=chunksize))
 
-    # Create a context to pass to tasks
-    ctx = Context()
+    failed = [pair for pair, succeeded in zip(file_pairs, results) if not succeeded]
+    if failed:
+        print(f"Task '{task_name}' failed for {len(failed)} of {len(file_pairs)} files:")
+        for input_file, _ in failed:
+            print(f"  {input_file}")
+    return failed
 
+def main():
     #task_name = "create_word_from_x2doc"
     task_name = "create_x2doc_from_word"
-    
-    # Example arguments to pass to the task
-    #args = ['/home/zwym/Documents/eclipse/products/products/src/x2doc/product_catalog_model_tako_tm/TaKo_tm_Deployment_Analysis.x2doc', '/home/zwym/Documents/eclipse/products/products/src/x2doc/product_catalog_model_tako_tm/TaKo_tm_Deployment_Analysis.docx']
-    args = ['/home/zwym/Documents/eclipse/products/products/src/x2doc/product_catalog_model_tako_tm/TaKo_tm_Deployment_Analysis.docx', '/home/zwym/Documents/eclipse/products/products/src/x2doc/product_catalog_model_tako_tm/TaKo_tm_Deployment_Analysis.x2doc']
 
-    # Execute the specified task along with its dependencies
-    execute_task(ns, task_name, ctx, None, *args)
+    # Directory with the documents to convert
+    source_dir = Path('/home/zwym/Documents/eclipse/products/products/src/x2doc/product_catalog_model_tako_tm')
+
+    # Example (input, output) pairs, one per document in the directory
+    # Word lock files (~$name.docx) are skipped, they are not valid documents
+    #file_pairs = [(str(f), str(f.with_suffix('.docx'))) for f in sorted(source_dir.glob('*.x2doc'))]
+    file_pairs = [
+        (str(f), str(f.with_suffix('.x2doc')))
+        for f in sorted(source_dir.glob('*.docx'))
+        if not f.name.startswith('~$')
+    ]
+
+    # Execute the specified task along with its dependencies for every pair
+    execute_task_batch(task_name, file_pairs)
 
 if __name__ == '__main__':
     main()
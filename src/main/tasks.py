@@ -15,7 +15,7 @@ def create_word_from_x2doc(c, input_file, output_file):
         print(f"File {output_file} already exists. Will be overwritten.")
         os.remove(output_file)
    
-    doc = Document.from_xml(input_file.read_text())
+    doc = Document.from_xml(input_file)
     doc.to_word(output_file)
     
 @task
@@ -31,5 +31,5 @@ def create_x2doc_from_word(c, input_file, output_file):
         os.remove(output_file)
    
     doc = Document.from_word(input_file)
-    output_file.write_text(doc.to_xml())
+    doc.to_xml_file(output_file)
     